@@ -5,7 +5,10 @@ import threading
 import time
 import traceback
 import os
+from concurrent.futures import ThreadPoolExecutor
 from PyQt6.QtCore import QObject, pyqtSignal
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from librespot.audio.decoders import AudioQuality, VorbisOnlyAudioQuality
 from librespot.metadata import TrackId, EpisodeId
 from yt_dlp import YoutubeDL
@@ -26,6 +29,34 @@ from .utils import format_item_path, convert_audio_format, embed_metadata, set_m
 
 logger = get_logger("downloader")
 
+# Shared session so direct file and subtitle downloads reuse pooled keep-alive
+# connections instead of doing a fresh TCP + TLS handshake per request.
+http_session = requests.Session()
+http_adapter = HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    # Retry transient server errors but hand the final response back instead of
+    # raising. Callers check status_code themselves. 429 is left out so throttled
+    # items fail and are picked up again by the RetryWorker.
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[500, 502, 503, 504],
+        raise_on_status=False
+    )
+)
+http_session.mount('http://', http_adapter)
+http_session.mount('https://', http_adapter)
+
+# Compiled once, the yt-dlp progress hook runs on every downloaded fragment
+percent_pattern = re.compile(r'(\d+\.\d+)%')
+
+deezer_media_headers = {
+    'Origin': 'https://www.deezer.com',
+    'Accept-Encoding': 'utf-8',
+    'Referer': 'https://www.deezer.com/login',
+}
+
 
 class RetryWorker(QObject):
     progress = pyqtSignal(dict, str, int)
@@ -91,7 +122,7 @@ class DownloadWorker(QObject):
 
     def yt_dlp_progress_hook(self, item, d):
         progress = item['gui']['progress_bar'].value()
-        progress_str = re.search(r'(\d+\.\d+)%', d['_percent_str'])
+        progress_str = percent_pattern.search(d['_percent_str'])
         updated_progress_value = round(float(progress_str.group(1))) - 1
         if updated_progress_value >= progress:
             self.progress.emit(item, self.tr("Downloading"), updated_progress_value)
@@ -99,6 +130,18 @@ class DownloadWorker(QObject):
             raise Exception("Download cancelled by user.")
 
 
+    def fetch_subtitle(self, key, url):
+        try:
+            response = http_session.get(url)
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Failed to fetch '{key}' subtitles, Error: {str(e)}")
+            return None
+        if response.status_code != 200:
+            logger.error(f"Failed to fetch '{key}' subtitles, Status: {response.status_code}")
+            return None
+        return response.text
+
+
     def run(self):
         while self.is_running:
             try:
@@ -182,9 +225,10 @@ class DownloadWorker(QObject):
 
                     for entry in os.listdir(file_directory):
                         full_path = os.path.join(file_directory, entry)  # Construct the full file path
+                        entry_name, entry_ext = os.path.splitext(entry)
 
-                        # Check if the entry is a file and if its name matches the base filename
-                        if os.path.isfile(full_path) and os.path.splitext(entry)[0] == base_filename and os.path.splitext(entry)[1] not in ['.lrc', '.ass', '.srt', '.vtt']:
+                        # Check if the name matches the base filename before hitting the disk to check it is a file
+                        if entry_name == base_filename and entry_ext not in ('.lrc', '.ass', '.srt', '.vtt') and os.path.isfile(full_path):
 
                             item['file_path'] = os.path.join(file_directory, entry)
                             if item_type in ['track', 'podcast_episode']:
@@ -308,12 +352,6 @@ class DownloadWorker(QObject):
                             bitrate = "256k"
                         temp_file_path += default_format
 
-                        headers = {
-                            'Origin': 'https://www.deezer.com',
-                            'Accept-Encoding': 'utf-8',
-                            'Referer': 'https://www.deezer.com/login',
-                        }
-
                         track_data = token['session'].post(
                             "https://media.deezer.com/v1/get_url",
                             json={
@@ -326,7 +364,7 @@ class DownloadWorker(QObject):
                                 }],
                                 'track_tokens': [song["TRACK_TOKEN"]]
                             },
-                            headers = headers
+                            headers = deezer_media_headers
                         ).json()
 
                         try:
@@ -342,36 +380,38 @@ class DownloadWorker(QObject):
                             urlkey = genurlkey(song["SNG_ID"], song["MD5_ORIGIN"], song["MEDIA_VERSION"], song_quality)
                             url = "https://e-cdns-proxy-%s.dzcdn.net/mobile/1/%s" % (song["MD5_ORIGIN"][0], urlkey.decode())
 
-                        file = requests.get(url, stream=True)
+                        with http_session.get(url, stream=True) as file:
+                            if file.status_code == 200:
+                                total_size = int(file.headers.get('content-length', 0))
+                                downloaded = 0
+                                # Joined once after the loop, concatenating bytes per chunk
+                                # copies the whole buffer each time and is quadratic.
+                                data_chunks = []
 
-                        if file.status_code == 200:
-                            total_size = int(file.headers.get('content-length', 0))
-                            downloaded = 0
-                            data_chunks = b''  # empty bytes object
-
-                            for data in file.iter_content(chunk_size=config.get("download_chunk_size")):
-                                downloaded += len(data)
-                                data_chunks += data
+                                for data in file.iter_content(chunk_size=config.get("download_chunk_size")):
+                                    downloaded += len(data)
+                                    data_chunks.append(data)
 
-                                if downloaded != total_size:
-                                    if item['item_status'] == 'Cancelled':
-                                        raise Exception("Download cancelled by user.")
-                                    if self.gui:
-                                        self.progress.emit(item, self.tr("Downloading"), int((downloaded / total_size) * 100))
+                                    if downloaded != total_size:
+                                        if item['item_status'] == 'Cancelled':
+                                            raise Exception("Download cancelled by user.")
+                                        if self.gui:
+                                            self.progress.emit(item, self.tr("Downloading"), int((downloaded / total_size) * 100))
 
-                            key = calcbfkey(song["SNG_ID"])
+                                key = calcbfkey(song["SNG_ID"])
 
-                            if self.gui:
-                                self.progress.emit(item, self.tr("Decrypting"), 99)
-                            with open(temp_file_path, "wb") as fo:
-                                decryptfile(data_chunks, key, fo)
+                                if self.gui:
+                                    self.progress.emit(item, self.tr("Decrypting"), 99)
+                                with open(temp_file_path, "wb") as fo:
+                                    decryptfile(b''.join(data_chunks), key, fo)
 
-                        else:
-                            logger.info(f"Deezer download attempts failed: {file.status_code}")
-                            item['item_status'] = "Failed"
-                            if self.gui:
-                                self.progress.emit(item, self.tr("Failed"), 0)
-                            self.readd_item_to_download_queue(item)
+                            else:
+                                logger.info(f"Deezer download attempts failed: {file.status_code}")
+                                item['item_status'] = "Failed"
+                                if self.gui:
+                                    self.progress.emit(item, self.tr("Failed"), 0)
+                                self.readd_item_to_download_queue(item)
+                                continue
 
                     elif item_service in ("soundcloud", "youtube_music"):
                         item_url = item_metadata['item_url']
@@ -399,10 +439,13 @@ class DownloadWorker(QObject):
                             ydl_opts['progress_hooks'] = [lambda d: self.yt_dlp_progress_hook(item, d)]
                         with YoutubeDL(ydl_opts) as video:
                             if item_service == "soundcloud" and token['oauth_token']:
-                                info_dict = video.extract_info(item_url)
+                                # extract_info already downloads, reuse its result instead
+                                # of resolving the track a second time through download()
+                                info_dict = video.extract_info(item_url, download=True)
                                 bitrate = f"{info_dict.get('abr')}k"
                                 default_format = f".{info_dict.get('audio_ext')}"
-                            video.download(item_url)
+                            else:
+                                video.download(item_url)
 
                     elif item_service in ("bandcamp", "qobuz", "tidal"):
                         if item_service in ("qobuz", "tidal"):
@@ -413,32 +456,27 @@ class DownloadWorker(QObject):
                             default_format = '.mp3'
                             bitrate = "128k"
                             file_url = item_metadata['file_url']
-                        response = requests.get(file_url, stream=True)
-                        total_size = int(response.headers.get('Content-Length', 0))
-                        downloaded = 0
-                        data_chunks = b''
-                        with open(temp_file_path, 'wb') as file:
-                            for data in response.iter_content(chunk_size=config.get("download_chunk_size", 1024)):
-                                if data:
-                                    downloaded += len(data)
-                                    data_chunks += data
-                                    file.write(data)
-
-                                    if total_size > 0 and downloaded != total_size:
-                                        if item['item_status'] == 'Cancelled':
-                                            raise Exception("Download cancelled by user.")
-                                        if self.gui:
-                                            self.progress.emit(item, self.tr("Downloading"), int((downloaded / total_size) * 100))
+                        with http_session.get(file_url, stream=True) as response:
+                            total_size = int(response.headers.get('Content-Length', 0))
+                            downloaded = 0
+                            with open(temp_file_path, 'wb') as file:
+                                for data in response.iter_content(chunk_size=config.get("download_chunk_size", 1024)):
+                                    if data:
+                                        downloaded += len(data)
+                                        file.write(data)
+
+                                        if total_size > 0 and downloaded != total_size:
+                                            if item['item_status'] == 'Cancelled':
+                                                raise Exception("Download cancelled by user.")
+                                            if self.gui:
+                                                self.progress.emit(item, self.tr("Downloading"), int((downloaded / total_size) * 100))
 
                     elif item_service == "apple_music":
                         default_format = '.m4a'
                         bitrate = "256k"
                         webplayback_info = apple_music_get_webplayback_info(token, item_id)
 
-                        stream_url = None
-                        for asset in webplayback_info["assets"]:
-                            if asset["flavor"] == "28:ctrp256":
-                                stream_url = asset["URL"]
+                        stream_url = next((asset["URL"] for asset in reversed(webplayback_info["assets"]) if asset["flavor"] == "28:ctrp256"), None)
 
                         if not stream_url:
                             logger.error(f'Apple music playback info invalid: {webplayback_info}')
@@ -645,19 +683,25 @@ class DownloadWorker(QObject):
 
                             subtitle_dict = item_metadata.get("subtitle_urls")
                             if config.get("download_all_available_subtitles"):
-                                for key in subtitle_dict:
-                                    subtitle_data = requests.get(subtitle_dict[key].get("url")).text
+                                # Fetch every language concurrently over the shared session,
+                                # map() keeps the results in subtitle_dict order.
+                                with ThreadPoolExecutor(max_workers=4) as executor:
+                                    subtitle_texts = list(executor.map(lambda key: self.fetch_subtitle(key, subtitle_dict[key].get("url")), subtitle_dict))
+                                for key, subtitle_data in zip(subtitle_dict, subtitle_texts):
+                                    if subtitle_data is None:
+                                        continue
                                     subtitle_file = file_path + f".{key}." + subtitle_dict[key].get("ext")
                                     with open(subtitle_file, "w") as file:
                                         file.write(subtitle_data)
                                     subtitle_files.append(subtitle_file)
                             else:
                                 lang = config.get("preferred_subtitle_language")
-                                subtitle_data = requests.get(subtitle_dict[lang].get("url")).text
-                                subtitle_file = file_path + f".{lang}." + subtitle_dict[lang].get("ext")
-                                with open(subtitle_file, "w") as file:
-                                    file.write(subtitle_data)
-                                subtitle_files.append(subtitle_file)
+                                subtitle_data = self.fetch_subtitle(lang, subtitle_dict[lang].get("url"))
+                                if subtitle_data is not None:
+                                    subtitle_file = file_path + f".{lang}." + subtitle_dict[lang].get("ext")
+                                    with open(subtitle_file, "w") as file:
+                                        file.write(subtitle_data)
+                                    subtitle_files.append(subtitle_file)
 
                         if not config.get("raw_media_format"):
                             item['item_status'] = 'Converting'